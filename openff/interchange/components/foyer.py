@@ -1,9 +1,25 @@
 from abc import abstractmethod
-from copy import copy
-from typing import TYPE_CHECKING, Dict, Type
-
+from collections.abc import Mapping
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+import numpy as np
 from openff.units import unit
-from openff.utilities.utilities import has_package
+from openff.utilities.exceptions import MissingOptionalDependency
+from pydantic import Field, PrivateAttr, validator
 
 from openff.interchange.components.potentials import Potential, PotentialHandler
 from openff.interchange.models import PotentialKey, TopologyKey
@@ -11,56 +27,181 @@ from openff.interchange.types import FloatQuantity
 
 if TYPE_CHECKING:
     from foyer.forcefield import Forcefield
-    from foyer.topology_graph import TopologyGraph
 
     from openff.interchange.components.mdtraj import OFFBioTop
 
 # Is this the safest way to achieve PotentialKey id separation?
 POTENTIAL_KEY_SEPARATOR = "-"
 
+# Units of Foyer parameters, built once here rather than on every lookup
+_U_ENERGY = unit.kJ / unit.mol
+_U_LENGTH = unit.nm
+_U_K_BOND = unit.kJ / unit.mol / unit.nm ** 2
+_U_K_ANGLE = unit.kJ / unit.mol / unit.radian ** 2
+_U_K_PERIODIC = unit.kJ / unit.mol / unit.nm ** 2
+_U_DIMENSIONLESS = unit.dimensionless
+_U_CHARGE = unit.elementary_charge
+
+try:
+    from foyer.atomtyper import find_atomtypes
+    from foyer.exceptions import MissingForceError, MissingParametersError
+    from foyer.topology_graph import TopologyGraph
+
+    _HAS_FOYER = True
+except ImportError:
+    _HAS_FOYER = False
+
+    # Stand-ins so that ``except`` clauses stay valid; these are never raised
+    class MissingForceError(Exception):  # type: ignore[no-redef]
+        pass
+
+    class MissingParametersError(Exception):  # type: ignore[no-redef]
+        pass
+
+
+# Parameters already looked up from each Foyer force field, keyed by group and
+# key. Force fields are held weakly so that caching does not keep them alive
+_PARAMETER_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_parameters(
+    forcefield: "Forcefield", group: str, key: Union[str, List[str]]
+) -> Mapping:
+    """Look up parameters from a Foyer force field, caching them per force field.
+    The parameters are shared between calls, so a read-only view is returned."""
+    cache_key = (group, key if isinstance(key, str) else tuple(key))
+    try:
+        cached = _PARAMETER_CACHE.setdefault(forcefield, dict())
+    except TypeError:
+        # Force fields which cannot be weakly referenced are not cached
+        return MappingProxyType(forcefield.get_parameters(group, key=key))
 
-if has_package("foyer"):
-    from foyer.topology_graph import TopologyGraph  # noqa
+    if cache_key not in cached:
+        cached[cache_key] = forcefield.get_parameters(group, key=key)
+    return MappingProxyType(cached[cache_key])
 
 
-def _copy_params(
-    params: Dict[str, float], *drop_keys: str, param_units: Dict = None
-) -> Dict:
+def _copy_params(params: Mapping, *drop_keys: str, param_units: Dict = None) -> Dict:
     """copy parameters from a dictionary"""
-    params_copy = copy(params)
-    for drop_key in drop_keys:
-        params_copy.pop(drop_key, None)
+    drop = set(drop_keys)
+    params_copy = {key: val for key, val in params.items() if key not in drop}
     if param_units:
-        for unit_item, units in param_units.items():
-            params_copy[unit_item] = params_copy[unit_item] * units
+        # Index every parameter that needs units so that missing ones still raise
+        for key, units in param_units.items():
+            params_copy[key] = params_copy[key] * units
     return params_copy
 
 
 def _get_potential_key_id(atom_slots: Dict[TopologyKey, PotentialKey], idx):
     """From a dictionary of TopologyKey: PotentialKey, get the PotentialKey id"""
-    top_key = TopologyKey(atom_indices=(idx,))
+    top_key = TopologyKey.from_indices((idx,))
     return atom_slots[top_key].id
 
 
+def _get_atomtypes_by_index(
+    atom_slots: Dict[TopologyKey, PotentialKey], n_atoms: int
+) -> List[str]:
+    """From a dictionary of TopologyKey: PotentialKey, get a list of PotentialKey ids
+    indexed by topology atom index"""
+    atomtype_of: List = [None] * n_atoms
+    for top_key, pot_key in atom_slots.items():
+        atomtype_of[top_key.atom_indices[0]] = pot_key.id
+    return atomtype_of
+
+
+def _pair_indices(connection: Iterable) -> Tuple[int, int]:
+    atom1, atom2 = connection
+    return atom1.topology_atom_index, atom2.topology_atom_index
+
+
+def _triplet_indices(connection: Iterable) -> Tuple[int, int, int]:
+    atom1, atom2, atom3 = connection
+    return (
+        atom1.topology_atom_index,
+        atom2.topology_atom_index,
+        atom3.topology_atom_index,
+    )
+
+
+def _quadruplet_indices(connection: Iterable) -> Tuple[int, int, int, int]:
+    atom1, atom2, atom3, atom4 = connection
+    return (
+        atom1.topology_atom_index,
+        atom2.topology_atom_index,
+        atom3.topology_atom_index,
+        atom4.topology_atom_index,
+    )
+
+
+# Unrolled per-arity getters, avoiding a generator per connection
+_INDEX_GETTERS: Dict[int, Callable[[Iterable], Tuple[int, ...]]] = {
+    2: _pair_indices,
+    3: _triplet_indices,
+    4: _quadruplet_indices,
+}
+
+
+def _indices_array(connections: Iterable, arity: int) -> np.ndarray:
+    """Flatten an iterable of connections, each an iterable of topology atoms, into
+    a dense (n_connections, arity) array of topology atom indices"""
+    flat_indices = np.fromiter(
+        chain.from_iterable(map(_INDEX_GETTERS[arity], connections)),
+        dtype=np.int64,
+    )
+    return flat_indices.reshape(-1, arity)
+
+
+def _bond_indices(topology: "OFFBioTop") -> np.ndarray:
+    return _indices_array((bond.atoms for bond in topology.topology_bonds), 2)
+
+
+def _angle_indices(topology: "OFFBioTop") -> np.ndarray:
+    return _indices_array(topology.angles, 3)
+
+
+def _proper_indices(topology: "OFFBioTop") -> np.ndarray:
+    return _indices_array(topology.propers, 4)
+
+
+def _improper_indices(topology: "OFFBioTop") -> np.ndarray:
+    return _indices_array(topology.impropers, 4)
+
+
+_CONNECTION_INDICES: Dict[str, Callable[["OFFBioTop"], np.ndarray]] = {
+    "topology_bonds": _bond_indices,
+    "angles": _angle_indices,
+    "propers": _proper_indices,
+    "impropers": _improper_indices,
+}
+
+
+class _AtomtypeInterner:
+    """Map atomtype names to small ints, and back"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = dict()
+        self.names: List[str] = list()
+
+    def intern(self, atomtype: str) -> int:
+        idx = self.ids.get(atomtype)
+        if idx is None:
+            idx = self.ids[atomtype] = len(self.names)
+            self.names.append(atomtype)
+        return idx
+
+
 def get_handlers_callable() -> Dict[str, Type[PotentialHandler]]:
-    return {
-        "vdW": FoyerVDWHandler,
-        "Electrostatics": FoyerElectrostaticsHandler,
-        "Bonds": FoyerHarmonicBondHandler,
-        "Angles": FoyerHarmonicAngleHandler,
-        "RBTorsions": FoyerRBProperHandler,
-        "RBImpropers": FoyerRBImproperHandler,
-        "ProperTorsions": FoyerPeriodicProperHandler,
-        "ImproperTorsions": FoyerPeriodicImproperHandler,
-    }
+    """Get the handler classes used to build an Interchange from a Foyer force field.
+    The returned dictionary is shared and must not be modified."""
+    return _HANDLERS
 
 
 class FoyerVDWHandler(PotentialHandler):
     type: str = "atoms"
     expression: str = "4*epsilon*((sigma/r)**12-(sigma/r)**6)"
     mixing_rule: str = "geometric"
-    slot_map: Dict[TopologyKey, PotentialKey] = dict()
-    potentials: Dict[PotentialKey, Potential] = dict()
+    slot_map: Dict[TopologyKey, PotentialKey] = Field(default_factory=dict)
+    potentials: Dict[PotentialKey, Potential] = Field(default_factory=dict)
     scale_13: float = 0.0
     scale_14: float = 0.5  # TODO: Replace with Foyer API point?
     scale_15: float = 1.0
@@ -73,86 +214,225 @@ class FoyerVDWHandler(PotentialHandler):
         topology: "OFFBioTop",
     ) -> None:
         """Populate slotmap with key-val pairs of slots and unique potential Identifiers"""
-        from foyer.atomtyper import find_atomtypes
+        if not _HAS_FOYER:
+            raise MissingOptionalDependency("foyer")
 
-        top_graph = TopologyGraph.from_openff_topology(openff_topology=topology)
-        type_map = find_atomtypes(top_graph, forcefield=forcefield)
-        for key, val in type_map.items():
-            top_key = TopologyKey(atom_indices=(key,))
-            self.slot_map[top_key] = PotentialKey(id=val["atomtype"])
+        atomtypes: List = [None] * topology.n_topology_atoms
 
-    def store_potentials(self, forcefield: "Forcefield") -> None:
-        for top_key in self.slot_map:
-            atom_params = forcefield.get_parameters(
-                self.type, key=self.slot_map[top_key].id
+        # Atomtype each unique molecule once and broadcast the result to every
+        # copy of it, rather than atomtyping, e.g., every water in a solvent box
+        for reference_molecule in topology.reference_molecules:
+            top_graph = TopologyGraph.from_openff_topology(
+                openff_topology=reference_molecule.to_topology()
             )
+            type_map = find_atomtypes(top_graph, forcefield=forcefield)
+
+            for top_mol in topology._reference_molecule_to_topology_molecules[
+                reference_molecule
+            ]:
+                for topology_atom in top_mol.atoms:
+                    reference_index = topology_atom.atom.molecule_atom_index
+                    atomtypes[topology_atom.topology_atom_index] = type_map[
+                        reference_index
+                    ]["atomtype"]
+
+        # Share one PotentialKey between all atoms of each atomtype in this call,
+        # instead of validating a new key per atom
+        pot_keys = {atomtype: PotentialKey(id=atomtype) for atomtype in set(atomtypes)}
+
+        self.slot_map.update(
+            {
+                TopologyKey.from_indices((idx,)): pot_keys[atomtype]
+                for idx, atomtype in enumerate(atomtypes)
+            }
+        )
+
+    def store_potentials(self, forcefield: "Forcefield") -> None:
+        potentials = dict()
+
+        # Iterate over unique potential keys, in order of first appearance
+        for pot_key in dict.fromkeys(self.slot_map.values()):
+            atom_params = _get_parameters(forcefield, self.type, pot_key.id)
 
             atom_params = _copy_params(
                 atom_params,
                 "charge",
-                param_units={"epsilon": unit.kJ / unit.mol, "sigma": unit.nm},
+                param_units={"epsilon": _U_ENERGY, "sigma": _U_LENGTH},
             )
 
-            self.potentials[self.slot_map[top_key]] = Potential(parameters=atom_params)
+            potentials[pot_key] = Potential(parameters=atom_params)
+
+        self.potentials.update(potentials)
+
+
+class _AtomCharges(Mapping):
+    """A read-only mapping between single-atom TopologyKey objects and partial
+    charges. Charges are stored as an array of floats, in units of elementary charge
+    and indexed by topology atom index, and only wrapped in a Quantity when looked
+    up. Atoms without a charge are stored as NaN."""
+
+    def __init__(self, magnitudes: Optional[np.ndarray] = None):
+        if magnitudes is None:
+            magnitudes = np.empty(0, dtype=np.float64)
+        self._magnitudes = np.array(magnitudes, dtype=np.float64)
+        self._magnitudes.flags.writeable = False
+        self._indices = np.flatnonzero(~np.isnan(self._magnitudes))
+
+    @classmethod
+    def from_mapping(cls, charges: Mapping) -> "_AtomCharges":
+        """Build from a mapping between single-atom TopologyKey objects and charges,
+        which are either Quantities or floats in units of elementary charge"""
+        for top_key in charges:
+            is_single_atom = len(top_key.atom_indices) == 1 and top_key.mult is None
+            if not is_single_atom or top_key.atom_indices[0] < 0:
+                raise ValueError(
+                    f"Charges must be keyed by single atoms, found {top_key}"
+                )
+
+        n_slots = 1 + max((key.atom_indices[0] for key in charges), default=-1)
+        magnitudes = np.full(n_slots, np.nan, dtype=np.float64)
+        for top_key, charge in charges.items():
+            if isinstance(charge, unit.Quantity):
+                charge = charge.m_as(_U_CHARGE)
+            magnitudes[top_key.atom_indices[0]] = charge
+        return cls(magnitudes)
+
+    @property
+    def magnitudes(self) -> np.ndarray:
+        """The charge of each atom, in units of elementary charge"""
+        return self._magnitudes
+
+    def __getitem__(self, top_key: TopologyKey) -> unit.Quantity:
+        if len(top_key.atom_indices) != 1 or top_key.mult is not None:
+            raise KeyError(top_key)
+        idx = top_key.atom_indices[0]
+        if not 0 <= idx < len(self._magnitudes) or np.isnan(self._magnitudes[idx]):
+            raise KeyError(top_key)
+        return unit.Quantity(float(self._magnitudes[idx]), _U_CHARGE)
+
+    def __iter__(self) -> Iterator[TopologyKey]:
+        return (TopologyKey.from_indices((idx,)) for idx in self._indices.tolist())
+
+    def __len__(self) -> int:
+        return len(self._indices)
 
 
 class FoyerElectrostaticsHandler(PotentialHandler):
     type: str = "Electrostatics"
     method: str = "pme"
     expression: str = "coul"
-    charges: Dict[TopologyKey, float] = dict()
+    charges: _AtomCharges = Field(default_factory=_AtomCharges)
     scale_13: float = 0.0
     scale_14: float = 0.5  # TODO: Replace with Foyer API point?
     scale_15: float = 1.0
     cutoff: FloatQuantity["angstrom"] = 9.0 * unit.angstrom  # type: ignore
 
+    @validator("charges", pre=True)
+    def validate_charges(cls, v):
+        if isinstance(v, _AtomCharges):
+            return v
+        return _AtomCharges.from_mapping(v)
+
     def store_charges(
         self,
         atom_slots: Dict[TopologyKey, PotentialKey],
         forcefield: "Forcefield",
     ):
-        for top_key, pot_key in atom_slots.items():
-            foyer_params = forcefield.get_parameters("atoms", pot_key.id)
-            charge = foyer_params["charge"]
-            charge = charge * unit.elementary_charge
-            self.charges[top_key] = charge
+        # Many atoms typically share a handful of atomtypes, so only look up
+        # the charge of each distinct atomtype once
+        charge_by_type = {
+            atomtype: _get_parameters(forcefield, "atoms", atomtype)["charge"]
+            for atomtype in {pot_key.id for pot_key in atom_slots.values()}
+        }
+
+        n_atoms = len(atom_slots)
+        atom_indices = np.fromiter(
+            (top_key.atom_indices[0] for top_key in atom_slots),
+            dtype=np.int64,
+            count=n_atoms,
+        )
+        atom_charges = np.fromiter(
+            (charge_by_type[pot_key.id] for pot_key in atom_slots.values()),
+            dtype=np.float64,
+            count=n_atoms,
+        )
+
+        # Merge with any charges which have already been stored
+        existing = self.charges.magnitudes
+        n_slots = max(len(existing), atom_indices.max() + 1 if n_atoms else 0)
+        magnitudes = np.full(n_slots, np.nan, dtype=np.float64)
+        magnitudes[: len(existing)] = existing
+        magnitudes[atom_indices] = atom_charges
+
+        self.charges = _AtomCharges(magnitudes)
 
 
 class FoyerConnectedAtomsHandler(PotentialHandler):
+    slot_map: Dict[TopologyKey, PotentialKey] = Field(default_factory=dict)
+    potentials: Dict[PotentialKey, Potential] = Field(default_factory=dict)
     connection_attribute: str = ""
     raise_on_missing_params = True
 
+    # The atomtypes making up each joined PotentialKey id, kept so that they
+    # do not need to be split back out of the id when looking up parameters
+    _atomtypes: Dict[str, Tuple[str, ...]] = PrivateAttr(default_factory=dict)
+
     def store_matches(
         self,
         atom_slots: Dict[TopologyKey, PotentialKey],
         topology: "OFFBioTop",
     ) -> None:
-        for connection in getattr(topology, self.connection_attribute):
-            try:
-                atoms_iterable = connection.atoms
-            except AttributeError:
-                atoms_iterable = connection
-            atoms_indices = tuple(atom.topology_atom_index for atom in atoms_iterable)
-            top_key = TopologyKey(atom_indices=atoms_indices)
-
-            pot_key_ids = tuple(
-                _get_potential_key_id(atom_slots, idx) for idx in atoms_indices
-            )
+        atomtype_of = _get_atomtypes_by_index(atom_slots, topology.n_topology_atoms)
+        sep = POTENTIAL_KEY_SEPARATOR
 
-            self.slot_map[top_key] = PotentialKey(
-                id=POTENTIAL_KEY_SEPARATOR.join(pot_key_ids)
-            )
+        atom_indices = _CONNECTION_INDICES[self.connection_attribute](topology)
 
-    def store_potentials(self, forcefield: "Forcefield") -> None:
-        from foyer.exceptions import MissingForceError, MissingParametersError
+        if len(atom_indices) == 0:
+            return
 
-        for _, pot_key in self.slot_map.items():
-            try:
-                params = forcefield.get_parameters(
-                    self.type, key=pot_key.id.split(POTENTIAL_KEY_SEPARATOR)
+        # Intern atomtypes to small ints so that the atomtypes of every connection
+        # can be gathered, and deduplicated, as a single (n_connections, arity) array
+        interner = _AtomtypeInterner()
+        atomtype_ids = np.fromiter(
+            (interner.intern(atomtype) for atomtype in atomtype_of),
+            dtype=np.int64,
+            count=len(atomtype_of),
+        )
+        atomtype_names = interner.names
+
+        unique_ids, inverse = np.unique(
+            atomtype_ids[atom_indices], axis=0, return_inverse=True
+        )
+
+        pot_keys = list()
+        for row in unique_ids.tolist():
+            pot_key_ids = tuple(atomtype_names[idx] for idx in row)
+            pot_key_id = sep.join(pot_key_ids)
+            self._atomtypes[pot_key_id] = pot_key_ids
+            pot_keys.append(PotentialKey(id=pot_key_id))
+
+        self.slot_map.update(
+            {
+                TopologyKey.from_indices(tuple(atoms_indices)): pot_keys[pot_key_idx]
+                for atoms_indices, pot_key_idx in zip(
+                    atom_indices.tolist(), inverse.reshape(-1).tolist()
                 )
+            }
+        )
+
+    def store_potentials(self, forcefield: "Forcefield") -> None:
+        potentials = dict()
+
+        # Many connections share the same atomtypes, so only look up the
+        # parameters of each unique potential key once
+        for pot_key in dict.fromkeys(self.slot_map.values()):
+            atomtypes = self._atomtypes.get(pot_key.id)
+            if atomtypes is None:
+                atomtypes = tuple(pot_key.id.split(POTENTIAL_KEY_SEPARATOR))
+            try:
+                params = _get_parameters(forcefield, self.type, list(atomtypes))
                 params = self.get_params_with_units(params)
-                self.potentials[pot_key] = Potential(parameters=params)
+                potentials[pot_key] = Potential(parameters=params)
             except MissingForceError:
                 # Here, we can safely assume that the ForceGenerator is Missing
                 self.slot_map = {}
@@ -164,6 +444,8 @@ class FoyerConnectedAtomsHandler(PotentialHandler):
                 else:
                     pass
 
+        self.potentials.update(potentials)
+
     @abstractmethod
     def get_params_with_units(self, params):
         raise NotImplementedError
@@ -172,32 +454,29 @@ class FoyerConnectedAtomsHandler(PotentialHandler):
 class FoyerHarmonicBondHandler(FoyerConnectedAtomsHandler):
     type: str = "harmonic_bonds"
     expression: str = "1/2 * k * (r - length) ** 2"
-    slot_map: Dict[TopologyKey, PotentialKey] = dict()
-    potentials: Dict[PotentialKey, Potential] = dict()
+    slot_map: Dict[TopologyKey, PotentialKey] = Field(default_factory=dict)
+    potentials: Dict[PotentialKey, Potential] = Field(default_factory=dict)
     connection_attribute = "topology_bonds"
 
     def get_params_with_units(self, params):
         return _copy_params(
             params,
-            param_units={"k": unit.kJ / unit.mol / unit.nm ** 2, "length": unit.nm},
+            param_units={"k": _U_K_BOND, "length": _U_LENGTH},
         )
 
 
 class FoyerHarmonicAngleHandler(FoyerConnectedAtomsHandler):
     type: str = "harmonic_angles"
     expression: str = "0.5 * k * (theta-angle)**2"
-    slot_map: Dict[TopologyKey, PotentialKey] = dict()
-    potentials: Dict[PotentialKey, Potential] = dict()
+    slot_map: Dict[TopologyKey, PotentialKey] = Field(default_factory=dict)
+    potentials: Dict[PotentialKey, Potential] = Field(default_factory=dict)
     connection_attribute: str = "angles"
 
     def get_params_with_units(self, params):
-        return _copy_params(
-            {"k": params["k"], "angle": params["theta"]},
-            param_units={
-                "k": unit.kJ / unit.mol / unit.radian ** 2,
-                "angle": unit.dimensionless,
-            },
-        )
+        return {
+            "k": params["k"] * _U_K_ANGLE,
+            "angle": params["theta"] * _U_DIMENSIONLESS,
+        }
 
 
 class FoyerRBProperHandler(FoyerConnectedAtomsHandler):
@@ -207,15 +486,13 @@ class FoyerRBProperHandler(FoyerConnectedAtomsHandler):
         "C2 * cos(phi)**2 + C3 * cos(phi)**3 + "
         "C4 * cos(phi)**4 + C5 * cos(phi)**5"
     )
-    slot_map: Dict[TopologyKey, PotentialKey] = dict()
-    potentials: Dict[PotentialKey, Potential] = dict()
+    slot_map: Dict[TopologyKey, PotentialKey] = Field(default_factory=dict)
+    potentials: Dict[PotentialKey, Potential] = Field(default_factory=dict)
     connection_attribute: str = "propers"
     raise_on_missing_params: bool = False
 
     def get_params_with_units(self, params):
-        rb_params = {k.upper(): v for k, v in params.items()}
-        param_units = {k: unit.kJ / unit.mol for k in rb_params}
-        return _copy_params(rb_params, param_units=param_units)
+        return {k.upper(): v * _U_ENERGY for k, v in params.items()}
 
 
 class FoyerRBImproperHandler(FoyerRBProperHandler):
@@ -233,9 +510,9 @@ class FoyerPeriodicProperHandler(FoyerConnectedAtomsHandler):
         return _copy_params(
             params,
             param_units={
-                "k": unit.kJ / unit.mol / unit.nm ** 2,
-                "phase": unit.dimensionless,
-                "periodicity": unit.dimensionless,
+                "k": _U_K_PERIODIC,
+                "phase": _U_DIMENSIONLESS,
+                "periodicity": _U_DIMENSIONLESS,
             },
         )
 
@@ -253,5 +530,17 @@ class RBTorsionHandler(PotentialHandler):
         "C4 * (cos(phi - 180)) ** 4 + C5 * (cos(phi - 180)) ** 5 "
     )
     # independent_variables: Set[str] = {"C0", "C1", "C2", "C3", "C4", "C5"}
-    slot_map: Dict[TopologyKey, PotentialKey] = dict()
-    potentials: Dict[PotentialKey, Potential] = dict()
+    slot_map: Dict[TopologyKey, PotentialKey] = Field(default_factory=dict)
+    potentials: Dict[PotentialKey, Potential] = Field(default_factory=dict)
+
+
+_HANDLERS: Dict[str, Type[PotentialHandler]] = {
+    "vdW": FoyerVDWHandler,
+    "Electrostatics": FoyerElectrostaticsHandler,
+    "Bonds": FoyerHarmonicBondHandler,
+    "Angles": FoyerHarmonicAngleHandler,
+    "RBTorsions": FoyerRBProperHandler,
+    "RBImpropers": FoyerRBImproperHandler,
+    "ProperTorsions": FoyerPeriodicProperHandler,
+    "ImproperTorsions": FoyerPeriodicImproperHandler,
+}
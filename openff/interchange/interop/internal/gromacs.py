@@ -14,6 +14,7 @@ from openff.interchange.components.mdtraj import (
 )
 from openff.interchange.exceptions import UnsupportedExportError
 from openff.interchange.models import TopologyKey
+from openff.interchange.utils import _get_charge_magnitudes
 
 if TYPE_CHECKING:
     from openff.interchange.components.interchange import Interchange
@@ -280,7 +281,7 @@ def _write_atoms(
     top_file.write("[ atoms ]\n")
     top_file.write(";num, type, resnum, resname, atomname, cgnr, q, m\n")
 
-    charges = openff_sys.handlers["Electrostatics"].charges
+    charges = _get_charge_magnitudes(openff_sys.handlers["Electrostatics"].charges)
 
     for atom in openff_sys.topology.mdtop.atoms:
         atom_idx = atom.index
@@ -288,8 +289,7 @@ def _write_atoms(
         atom_type = typemap[atom.index]
         res_idx = atom.residue.index
         res_name = str(atom.residue)
-        top_key = TopologyKey(atom_indices=(atom_idx,))
-        charge = charges[top_key].m_as(unit.e)
+        charge = charges[atom_idx]
         top_file.write(
             "{:6d} {:18s} {:6d} {:8s} {:8s} {:6d} "
             "{:18.8f} {:18.8f}\n".format(
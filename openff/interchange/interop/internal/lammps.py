@@ -7,6 +7,7 @@ from openff.units import unit
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.exceptions import UnsupportedExportError
 from openff.interchange.models import TopologyKey
+from openff.interchange.utils import _get_charge_magnitudes
 
 
 def to_lammps(openff_sys: Interchange, file_path: Union[Path, str]):
@@ -239,7 +240,7 @@ def _write_atoms(lmp_file: IO, openff_sys: Interchange, atom_type_map: Dict):
     electrostatics_handler = openff_sys.handlers["Electrostatics"]
     vdw_hander = openff_sys.handlers["vdW"]
 
-    charges = electrostatics_handler.charges
+    charges = _get_charge_magnitudes(electrostatics_handler.charges)
 
     for atom in openff_sys.topology.mdtop.atoms:
 
@@ -249,7 +250,7 @@ def _write_atoms(lmp_file: IO, openff_sys: Interchange, atom_type_map: Dict):
         pot_key = vdw_hander.slot_map[top_key]
         atom_type = atom_type_map_inv[pot_key]
 
-        charge = charges[top_key].m_as(unit.e)
+        charge = charges[atom.index]
         pos = openff_sys.positions[atom.index].to(unit.angstrom).magnitude
         lmp_file.write(
             "{:d}\t{:d}\t{:d}\t{:.8g}\t{:.8g}\t{:.8g}\t{:.8g}\n".format(
@@ -10,7 +10,7 @@ from openff.interchange.exceptions import (
 )
 from openff.interchange.interop.parmed import _lj_params_from_potential
 from openff.interchange.models import PotentialKey, TopologyKey
-from openff.interchange.utils import pint_to_simtk
+from openff.interchange.utils import _get_charge_magnitudes, pint_to_simtk
 
 kcal_mol = unit.kilocalorie_per_mole
 kcal_ang = kcal_mol / unit.angstrom ** 2
@@ -384,13 +384,12 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
                     f"Electrostatics method {electrostatics_method} not supported"
                 )
 
-        partial_charges = electrostatics_handler.charges
+        partial_charges = _get_charge_magnitudes(electrostatics_handler.charges)
 
         for top_key, pot_key in vdw_handler.slot_map.items():
             atom_idx = top_key.atom_indices[0]
 
-            partial_charge = partial_charges[top_key]
-            # partial_charge = partial_charge.m_as(off_unit.elementary_charge)
+            partial_charge = partial_charges[atom_idx]
             vdw_potential = vdw_handler.potentials[pot_key]
             # these are floats, implicitly angstrom and kcal/mol
             sigma, epsilon = _lj_params_from_potential(vdw_potential)
@@ -400,14 +399,14 @@ def _process_nonbonded_forces(openff_sys, openmm_sys, combine_nonbonded_forces=F
             if combine_nonbonded_forces:
                 non_bonded_force.setParticleParameters(
                     atom_idx,
-                    partial_charge.m_as(off_unit.e),
+                    partial_charge,
                     sigma,
                     epsilon,
                 )
             else:
                 vdw_force.setParticleParameters(atom_idx, [sigma, epsilon])
                 electrostatics_force.setParticleParameters(
-                    atom_idx, partial_charge.m_as(off_unit.e), 0.0, 0.0
+                    atom_idx, partial_charge, 0.0, 0.0
                 )
 
     elif "Buckingham-6" in openff_sys.handlers:
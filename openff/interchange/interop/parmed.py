@@ -9,6 +9,7 @@ from openff.units import unit
 from openff.interchange.components.potentials import Potential
 from openff.interchange.exceptions import UnsupportedBoxError, UnsupportedExportError
 from openff.interchange.models import PotentialKey, TopologyKey
+from openff.interchange.utils import _get_charge_magnitudes
 
 if TYPE_CHECKING:
 
@@ -215,13 +216,11 @@ def _to_parmed(off_system: "Interchange") -> "pmd.Structure":
         pmd_atom.name = pmd_atom.type
 
     if has_electrostatics:
-        charges = electrostatics_handler.charges
+        charges = _get_charge_magnitudes(electrostatics_handler.charges)
 
     for pmd_idx, pmd_atom in enumerate(structure.atoms):
         if has_electrostatics:
-            top_key = TopologyKey(atom_indices=(pmd_idx,))
-            partial_charge = charges[top_key]
-            unitless_ = partial_charge.to(unit.elementary_charge).magnitude
+            unitless_ = charges[pmd_idx]
             pmd_atom.charge = float(unitless_)
             pmd_atom.atom_type.charge = float(unitless_)
         else:
@@ -17,6 +17,9 @@ class DefaultModel(BaseModel):
 
 
 class TopologyKey(DefaultModel):
+    # Not a field; caches the hash of this key, which is used heavily as a dict key
+    __slots__ = ("_hash",)
+
     atom_indices: Tuple[int, ...] = Field(
         tuple(), description="The indices of the atoms occupied by this interaction"
     )
@@ -24,8 +27,27 @@ class TopologyKey(DefaultModel):
         None, description="The index of this duplicate interaction"
     )
 
+    @classmethod
+    def from_indices(cls, atom_indices: Tuple[int, ...]) -> "TopologyKey":
+        """Build a key from a tuple of atom indices, skipping validation"""
+        return cls.construct(atom_indices=atom_indices)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        object.__setattr__(self, "_hash", None)
+
     def __hash__(self):
-        return hash((self.atom_indices, self.mult))
+        # The slot is unset on keys built via construct(), copy() or unpickling
+        _hash = getattr(self, "_hash", None)
+        if _hash is None:
+            _hash = hash((self.atom_indices, self.mult))
+            object.__setattr__(self, "_hash", _hash)
+        return _hash
+
+    def __eq__(self, other):
+        if isinstance(other, TopologyKey):
+            return (self.atom_indices, self.mult) == (other.atom_indices, other.mult)
+        return super().__eq__(other)
 
 
 class PotentialKey(DefaultModel):
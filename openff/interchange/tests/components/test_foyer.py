@@ -7,7 +7,13 @@ from openff.units import unit
 from openff.utilities.testing import skip_if_missing
 from openff.utilities.utilities import has_package
 
-from openff.interchange.components.foyer import RBTorsionHandler
+from openff.interchange.components.foyer import (
+    FoyerElectrostaticsHandler,
+    FoyerHarmonicBondHandler,
+    FoyerVDWHandler,
+    RBTorsionHandler,
+    _AtomCharges,
+)
 from openff.interchange.components.mdtraj import OFFBioTop
 from openff.interchange.components.potentials import Potential
 from openff.interchange.drivers import get_openmm_energies
@@ -31,6 +37,22 @@ if HAS_GROMACS:
 kj_mol = unit.Unit("kilojoule / mol")
 
 
+class _FakeFoyerForceField:
+    """Stand-in for a ``foyer.Forcefield``, serving parameters keyed by atomtype
+    (joined with "-" for connected atoms) and optionally counting lookups"""
+
+    def __init__(self, params, count_lookups=False):
+        self.params = params
+        self.n_lookups = 0 if count_lookups else None
+
+    def get_parameters(self, group, key):
+        if self.n_lookups is not None:
+            self.n_lookups += 1
+        if not isinstance(key, str):
+            key = "-".join(key)
+        return dict(self.params[key])
+
+
 @skip_if_missing("foyer")
 class TestFoyer(BaseTest):
     @pytest.fixture(scope="session")
@@ -52,6 +74,82 @@ class TestFoyer(BaseTest):
         assert oplsaa_system_ethanol["vdW"].scale_14 == 0.5
         assert oplsaa_system_ethanol["Electrostatics"].scale_14 == 0.5
 
+    def test_potential_keys_not_shared_between_handlers(self):
+        molecule = Molecule.from_smiles("CCO")
+        top = OFFBioTop.from_molecules(2 * [molecule])
+        oplsaa = foyer.Forcefield(name="oplsaa")
+
+        handler1 = FoyerVDWHandler()
+        handler1.store_matches(oplsaa, topology=top)
+        handler2 = FoyerVDWHandler()
+        handler2.store_matches(oplsaa, topology=top)
+
+        top_key = TopologyKey(atom_indices=(0,))
+        handler1.slot_map[top_key].mult = 1
+
+        assert handler2.slot_map[top_key].mult is None
+
+    def test_atomtyping_shared_between_copies(self):
+        from foyer.atomtyper import find_atomtypes
+        from foyer.topology_graph import TopologyGraph
+
+        # The second copy has a different atom order, so mapping its atoms back to
+        # the reference molecule is not the identity
+        top = OFFBioTop.from_molecules(
+            [
+                Molecule.from_smiles("CCO"),
+                Molecule.from_smiles("OCC"),
+                Molecule.from_smiles("CCO"),
+            ]
+        )
+        assert top.n_reference_molecules == 1
+        oplsaa = foyer.Forcefield(name="oplsaa")
+
+        handler = FoyerVDWHandler()
+        handler.store_matches(oplsaa, topology=top)
+
+        expected = find_atomtypes(
+            TopologyGraph.from_openff_topology(openff_topology=top),
+            forcefield=oplsaa,
+        )
+
+        assert len(handler.slot_map) == top.n_topology_atoms
+        for idx, val in expected.items():
+            top_key = TopologyKey(atom_indices=(idx,))
+            assert handler.slot_map[top_key].id == val["atomtype"]
+
+    def test_connected_atoms_potential_keys(self, oplsaa_system_ethanol):
+        topology = oplsaa_system_ethanol.topology
+        vdw = oplsaa_system_ethanol["vdW"]
+
+        expected_connections = {
+            "Bonds": [bond.atoms for bond in topology.topology_bonds],
+            "Angles": topology.angles,
+            "RBTorsions": topology.propers,
+            "RBImpropers": topology.impropers,
+        }
+
+        for name, connections in expected_connections.items():
+            handler = oplsaa_system_ethanol[name]
+
+            assert [top_key.atom_indices for top_key in handler.slot_map] == [
+                tuple(atom.topology_atom_index for atom in connection)
+                for connection in connections
+            ]
+            assert {*handler.potentials} == {*handler.slot_map.values()}
+
+            # Potential keys with the same id are shared between slots
+            assert len({id(pot_key) for pot_key in handler.slot_map.values()}) == len(
+                handler.potentials
+            )
+
+            for top_key, pot_key in handler.slot_map.items():
+                atomtypes = [
+                    vdw.slot_map[TopologyKey(atom_indices=(idx,))].id
+                    for idx in top_key.atom_indices
+                ]
+                assert pot_key.id == "-".join(atomtypes)
+
     @needs_gmx
     @pytest.mark.slow
     @pytest.mark.skip(reason="Something is broken with RBTorsions in OpenMM export")
@@ -72,6 +170,133 @@ class TestFoyer(BaseTest):
         )
 
 
+class TestFoyerHandlers(BaseTest):
+    def test_charges_from_mapping(self):
+        handler = FoyerElectrostaticsHandler(
+            charges={
+                TopologyKey(atom_indices=(0,)): 0.1 * unit.elementary_charge,
+                TopologyKey(atom_indices=(1,)): -0.1,
+            }
+        )
+
+        assert handler.charges[TopologyKey(atom_indices=(0,))] == 0.1 * unit.e
+        assert np.allclose(handler.charges.magnitudes, [0.1, -0.1])
+
+    @pytest.mark.parametrize(
+        "top_key",
+        [
+            TopologyKey(atom_indices=()),
+            TopologyKey(atom_indices=(0, 1)),
+            TopologyKey(atom_indices=(-1,)),
+            TopologyKey(atom_indices=(0,), mult=1),
+        ],
+    )
+    def test_charges_from_mapping_invalid_keys(self, top_key):
+        with pytest.raises(ValueError, match="single atoms"):
+            _AtomCharges.from_mapping({top_key: 0.1})
+
+    def test_atom_charges_copies_array(self):
+        magnitudes = np.array([0.1, -0.1])
+        charges = _AtomCharges(magnitudes)
+
+        assert magnitudes.flags.writeable
+        magnitudes[0] = 0.2
+        assert charges.magnitudes[0] == 0.1
+
+    def test_store_charges_merges(self):
+        forcefield = _FakeFoyerForceField(
+            {"opls_135": {"charge": 0.1}, "opls_140": {"charge": -0.2}}
+        )
+        handler = FoyerElectrostaticsHandler()
+
+        handler.store_charges(
+            atom_slots={
+                TopologyKey(atom_indices=(0,)): PotentialKey(id="opls_135"),
+                TopologyKey(atom_indices=(1,)): PotentialKey(id="opls_135"),
+            },
+            forcefield=forcefield,
+        )
+        handler.store_charges(
+            atom_slots={
+                TopologyKey(atom_indices=(1,)): PotentialKey(id="opls_140"),
+                TopologyKey(atom_indices=(2,)): PotentialKey(id="opls_140"),
+            },
+            forcefield=forcefield,
+        )
+
+        assert len(handler.charges) == 3
+        assert np.allclose(handler.charges.magnitudes, [0.1, -0.2, -0.2])
+
+    def test_cached_parameters_are_read_only(self):
+        from openff.interchange.components.foyer import _get_parameters
+
+        class ScalingBondHandler(FoyerHarmonicBondHandler):
+            def get_params_with_units(self, params):
+                params["k"] *= 2
+                return super().get_params_with_units(params)
+
+        forcefield = _FakeFoyerForceField(
+            {"opls_135-opls_140": {"k": 1000.0, "length": 0.1}}
+        )
+        pot_key = PotentialKey(id="opls_135-opls_140")
+        top_key = TopologyKey(atom_indices=(0, 1))
+
+        with pytest.raises(TypeError):
+            ScalingBondHandler(slot_map={top_key: pot_key}).store_potentials(forcefield)
+
+        bonds = FoyerHarmonicBondHandler(slot_map={top_key: pot_key})
+        bonds.store_potentials(forcefield)
+
+        assert _get_parameters(
+            forcefield, "harmonic_bonds", ["opls_135", "opls_140"]
+        ) == {"k": 1000.0, "length": 0.1}
+        assert bonds.potentials[pot_key].parameters["k"] == 1000.0 * unit.Unit(
+            "kilojoule / mol / nanometer ** 2"
+        )
+
+    def test_parameter_lookups_are_cached(self):
+        forcefield = _FakeFoyerForceField(
+            {"opls_135": {"charge": 0.1, "epsilon": 0.5, "sigma": 0.3}},
+            count_lookups=True,
+        )
+        atom_slots = {
+            TopologyKey(atom_indices=(idx,)): PotentialKey(id="opls_135")
+            for idx in range(10)
+        }
+
+        vdw = FoyerVDWHandler(slot_map=atom_slots)
+        vdw.store_potentials(forcefield)
+        electrostatics = FoyerElectrostaticsHandler()
+        electrostatics.store_charges(atom_slots=atom_slots, forcefield=forcefield)
+
+        assert forcefield.n_lookups == 1
+        assert len(vdw.potentials) == 1
+        assert len(electrostatics.charges) == 10
+
+        for top_key in atom_slots:
+            assert electrostatics.charges[top_key] == 0.1 * unit.elementary_charge
+
+        assert np.allclose(electrostatics.charges.magnitudes, np.full(10, 0.1))
+        with pytest.raises(KeyError):
+            electrostatics.charges[TopologyKey(atom_indices=(10,))]
+
+    def test_store_matches_without_foyer(self, monkeypatch, ethanol_top):
+        from openff.utilities.exceptions import MissingOptionalDependency
+
+        from openff.interchange.components import foyer as foyer_module
+
+        monkeypatch.setattr(foyer_module, "_HAS_FOYER", False)
+
+        with pytest.raises(MissingOptionalDependency):
+            FoyerVDWHandler().store_matches(None, topology=ethanol_top)
+
+    def test_copy_params_missing_parameter(self):
+        from openff.interchange.components.foyer import _copy_params
+
+        with pytest.raises(KeyError, match="length"):
+            _copy_params({"k": 1.0}, param_units={"k": kj_mol, "length": unit.nm})
+
+
 class TestRBTorsions(BaseTest):
     @pytest.fixture(scope="class")
     def ethanol_with_rb_torsions(self):
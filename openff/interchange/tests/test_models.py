@@ -0,0 +1,29 @@
+import pickle
+
+from openff.interchange.models import TopologyKey
+from openff.interchange.tests import BaseTest
+
+
+class TestTopologyKey(BaseTest):
+    def test_from_indices(self):
+        key = TopologyKey.from_indices((0, 1))
+
+        assert key.atom_indices == (0, 1)
+        assert key.mult is None
+        assert key == TopologyKey(atom_indices=(0, 1))
+        assert hash(key) == hash(TopologyKey(atom_indices=(0, 1)))
+
+    def test_hash_follows_assignment(self):
+        key = TopologyKey(atom_indices=(0, 1))
+        hash(key)
+        key.mult = 1
+
+        assert hash(key) == hash(TopologyKey(atom_indices=(0, 1), mult=1))
+        assert key != TopologyKey(atom_indices=(0, 1))
+
+    def test_copies_as_dict_keys(self):
+        key = TopologyKey(atom_indices=(2, 3, 4))
+        mapping = {key: "foo"}
+
+        assert mapping[key.copy()] == "foo"
+        assert mapping[pickle.loads(pickle.dumps(key))] == "foo"
@@ -2,6 +2,7 @@ import pathlib
 from collections import OrderedDict
 
 from openff.toolkit.typing.engines.smirnoff import ForceField
+from openff.units import unit
 from pkg_resources import resource_filename
 from simtk import openmm
 from simtk import unit as omm_unit
@@ -38,6 +39,19 @@ def unwrap_list_of_pint_quantities(quantities):
     return vals * parsed_unit
 
 
+def _get_charge_magnitudes(charges):
+    """Return partial charges in units of e, indexable by atom index."""
+    # Foyer handlers store charges as one array; avoid a Quantity per atom
+    if hasattr(charges, "magnitudes"):
+        if len(charges) != len(charges.magnitudes):
+            raise KeyError("Partial charges are missing for some atoms")
+        return charges.magnitudes.tolist()
+    return {
+        top_key.atom_indices[0]: charge.m_as(unit.elementary_charge)
+        for top_key, charge in charges.items()
+    }
+
+
 def get_test_file_path(test_file) -> str:
     """Given a filename in the collection of data files, return its full path"""
     dir_path = resource_filename("openff.interchange", "tests/files/")